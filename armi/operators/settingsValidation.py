@@ -154,6 +154,12 @@ class Inspector:
         Parameters
         ----------
         cs : Settings
+
+        Notes
+        -----
+        Queries are rebuilt for every inspector rather than cached per set of plugins.
+        Their conditions and corrections close over this inspector, and their
+        statements are formatted with the setting values at construction time.
         """
         self.queries = []
         self.cs = cs
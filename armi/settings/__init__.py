@@ -23,6 +23,7 @@ of its own, and plugins typically register some of their own settings as well.
 import fnmatch
 import os
 import glob
+import re
 import shutil
 from typing import List, Union
 
@@ -82,53 +83,119 @@ def recursivelyLoadSettingsFiles(
         patterns, str
     ), "Bare string passed as patterns. Make sure to pass a list"
 
+    # single regexes matching any of the (ignore) patterns, so each file name is only
+    # checked once rather than once per pattern
+    patternRegex = _compileFilePatterns(patterns)
+    ignoreRegex = _compileFilePatterns(ignorePatterns) if ignorePatterns else None
+
     possibleSettings = []
     runLog.info("Finding potential settings files matching {}.".format(patterns))
     if recursive:
-        for directory, _list, files in os.walk(rootDir):
-            matches = set()
-            for pattern in patterns:
-                matches |= set(fnmatch.filter(files, pattern))
-            if ignorePatterns is not None:
-                for ignorePattern in ignorePatterns:
-                    matches -= set(fnmatch.filter(files, ignorePattern))
-            possibleSettings.extend(
-                [os.path.join(directory, fname) for fname in matches]
-            )
+        for entry in _scanFilesRecursively(rootDir):
+            fname = os.path.normcase(entry.name)
+            if not patternRegex.match(fname):
+                continue
+            if ignoreRegex is not None and ignoreRegex.match(fname):
+                continue
+            possibleSettings.append(entry.path)
     else:
         for pattern in patterns:
             possibleSettings.extend(glob.glob(pattern))
 
-    csFiles = []
     runLog.info("Checking for valid settings files.")
+    csFiles = []
     for possibleSettingsFile in possibleSettings:
-        if os.path.getsize(possibleSettingsFile) > 1e6:
-            runLog.info("skipping {} -- looks too big".format(possibleSettingsFile))
-            continue
-        try:
-            cs = Settings()
-            cs.loadFromInputFile(possibleSettingsFile, handleInvalids=handleInvalids)
+        cs = _loadPossibleSettingsFile(possibleSettingsFile, handleInvalids)
+        if cs is not None:
             csFiles.append(cs)
-            runLog.extra("loaded {}".format(possibleSettingsFile))
-        except InvalidSettingsFileError as ee:
-            runLog.info("skipping {}\n    {}".format(possibleSettingsFile, ee))
-        except yaml.composer.ComposerError as ee:
-            runLog.info(
-                "skipping {}; it appears to be an incomplete YAML snippet\n    {}".format(
-                    possibleSettingsFile, ee
-                )
-            )
-        except Exception as ee:
-            runLog.error(
-                "Failed to parse {}.\nIt looked like a settings file but gave this exception:\n{}: {}".format(
-                    possibleSettingsFile, type(ee).__name__, ee
-                )
-            )
-            raise
     csFiles.sort(key=lambda csFile: csFile.caseTitle)
     return csFiles
 
 
+def _scanFilesRecursively(rootDir):
+    """
+    Yield a ``DirEntry`` for every file below ``rootDir``.
+
+    Like :py:func:`os.walk`, this does not follow symbolic links to directories and
+    skips directories that cannot be read. Working with ``os.scandir`` directly lets
+    the file type cached on each entry be used, rather than re-building and re-
+    stat-ing joined paths.
+    """
+    directories = [rootDir]
+    while directories:
+        directory = directories.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        isDir = entry.is_dir()
+                    except OSError:
+                        isDir = False
+                    if not isDir:
+                        yield entry
+                    elif not entry.is_symlink():
+                        directories.append(entry.path)
+        except OSError:
+            continue
+
+
+def _compileFilePatterns(patterns: List[str]):
+    """
+    Compile shell-style file name patterns into one regular expression.
+
+    Like :py:func:`fnmatch.filter`, the patterns are case-normalized for the current
+    platform, so names should be passed through :py:func:`os.path.normcase` before
+    matching. An empty list of patterns matches nothing.
+    """
+    if not patterns:
+        # an empty alternation would match every name
+        return re.compile("(?!)")
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    )
+
+
+def _loadPossibleSettingsFile(possibleSettingsFile, handleInvalids=True):
+    """
+    Attempt to load a single candidate settings file.
+
+    Notes
+    -----
+    Candidates are loaded one at a time rather than in a thread pool. The round-trip
+    YAML loader is pure Python, so it holds the GIL, and loading a file also sets the
+    global log verbosities and may prompt the user about invalid settings.
+
+    Returns
+    -------
+    cs : Settings or None
+        The loaded settings, or None if the file does not appear to be a settings file.
+    """
+    if os.path.getsize(possibleSettingsFile) > 1e6:
+        runLog.info("skipping {} -- looks too big".format(possibleSettingsFile))
+        return None
+    try:
+        cs = Settings()
+        cs.loadFromInputFile(possibleSettingsFile, handleInvalids=handleInvalids)
+        runLog.extra("loaded {}".format(possibleSettingsFile))
+        return cs
+    except InvalidSettingsFileError as ee:
+        runLog.info("skipping {}\n    {}".format(possibleSettingsFile, ee))
+    except yaml.composer.ComposerError as ee:
+        runLog.info(
+            "skipping {}; it appears to be an incomplete YAML snippet\n    {}".format(
+                possibleSettingsFile, ee
+            )
+        )
+    except Exception as ee:
+        runLog.error(
+            "Failed to parse {}.\nIt looked like a settings file but gave this exception:\n{}: {}".format(
+                possibleSettingsFile, type(ee).__name__, ee
+            )
+        )
+        raise
+    return None
+
+
 def promptForSettingsFile(choice=None):
     """
     Allows the user to select an ARMI input from the input files in the directory
@@ -383,10 +383,14 @@ class Settings:
         # try to get the setting dict
         verbs = self["moduleVerbosity"]
 
+        # New loggers still have to come from logging.getLogger(), which hooks them into
+        # the logger hierarchy and uses the ARMI logger class.
+        existingLoggers = logging.Logger.manager.loggerDict
+
         # set, but don't use, the module-level loggers
         for mName, mLvl in verbs.items():
             # by default, we init module-level logging, not change it mid-run
-            if force or mName not in logging.Logger.manager.loggerDict:
+            if force or mName not in existingLoggers:
                 # cast verbosity to integer
                 lvl = int(mLvl) if mLvl.isnumeric() else runLog.LOG.logLevels[mLvl][0]
 
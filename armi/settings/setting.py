@@ -35,6 +35,8 @@ code-based re-implementation.
 import copy
 from collections import namedtuple
 import datetime
+import functools
+import sys
 from typing import List, Optional, Tuple
 
 import voluptuous as vol
@@ -51,6 +53,62 @@ Option = namedtuple("Option", ["option", "settingName"])
 Default = namedtuple("Default", ["value", "settingName"])
 
 
+@functools.lru_cache(maxsize=None)
+def _getCoercionSchema(valueType, isList):
+    """
+    Return a compiled schema that coerces values (or list entries) to ``valueType``.
+
+    Settings are rebuilt from the plugins every time a Settings object is created or
+    duplicated, and most of them derive one of only a handful of distinct coercion
+    schemas from their defaults. Compiled schemas are stateless, so they are shared
+    between settings rather than recompiled for each one.
+    """
+    if isList:
+        return _ListCoercionSchema(valueType)
+    return vol.Schema(vol.Coerce(valueType))
+
+
+class _ListCoercionSchema(vol.Schema):
+    """
+    A ``vol.Schema([vol.Coerce(valueType)])`` with a fast path for valid input.
+
+    Voluptuous validates sequences generically, dispatching through a compiled
+    validator and error bookkeeping for every entry. For the list settings whose schema
+    is derived from their default, valid input can simply be coerced entry by entry.
+    Anything else is handed to the regular schema, so invalid input still produces the
+    usual voluptuous errors, and ``schema`` still exposes the contained ``Coerce`` for
+    :py:attr:`Setting.containedType`.
+    """
+
+    def __init__(self, valueType):
+        vol.Schema.__init__(self, [vol.Coerce(valueType)])
+        self._valueType = valueType
+
+    def __call__(self, data):
+        if isinstance(data, list):
+            try:
+                # keep the input's list type (e.g. a round-trip ``CommentedSeq``), as
+                # voluptuous does
+                return type(data)([self._valueType(val) for val in data])
+            except Exception:  # pylint: disable=broad-except
+                # let the full schema report what went wrong
+                pass
+        return vol.Schema.__call__(self, data)
+
+
+@functools.lru_cache(maxsize=None)
+def _flagsFromString(typeSpec):
+    """
+    Memoized :py:meth:`Flags.fromString <armi.reactor.flags.Flags.fromString>`.
+
+    Flag list settings are validated every time they are set, and each entry otherwise
+    goes through the full regex-based flag parser. Flags are only ever added, never
+    renamed, and ``Flag`` objects are not modified in place, so a successful conversion
+    can safely be reused. Failed conversions raise and are therefore not cached.
+    """
+    return Flags.fromString(typeSpec)
+
+
 class Setting:
     """
     A particular setting.
@@ -66,8 +124,26 @@ class Setting:
     the custom object and when you call ``dump``, it will be serialized.
     Just accessing the value will return the actual object in this case.
 
+    Settings are created in bulk every time the plugins are collected, so the base
+    class uses ``__slots__`` to keep instances small. Subclasses that do not declare
+    their own ``__slots__`` still get a regular ``__dict__``.
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "label",
+        "options",
+        "enforcedOptions",
+        "subLabels",
+        "isEnvironment",
+        "oldNames",
+        "_default",
+        "_customSchema",
+        "schema",
+        "_value",
+    )
+
     def __init__(
         self,
         name,
@@ -120,7 +196,9 @@ class Setting:
             will result in errors, requiring to user to update their input by hand to
             use more current settings.
         """
-        self.name = name
+        # names are used as keys everywhere settings are looked up, so intern them
+        # once here so that lookups with interned keys can short-circuit on identity
+        self.name = sys.intern(str(name))
         self.description = description or name
         self.label = label or name
         self.options = options
@@ -171,9 +249,9 @@ class Setting:
                 # Coerce all values to the first entry in the default so mixed floats and ints work.
                 # Note that this will not work for settings that allow mixed
                 # types in their lists (e.g. [0, '10R']), so those all need custom schemas.
-                self.schema = vol.Schema([vol.Coerce(type(self.default[0]))])
+                self.schema = _getCoercionSchema(type(self.default[0]), isList=True)
             else:
-                self.schema = vol.Schema(vol.Coerce(type(self.default)))
+                self.schema = _getCoercionSchema(type(self.default), isList=False)
 
     @property
     def default(self):
@@ -267,11 +345,24 @@ class Setting:
             Note that we don't do it at the individual setting level because it'd be too
             O(N^2).
         """
-        state = copy.deepcopy(self.__dict__)
-        for trouble in ("schema", "_customSchema"):
-            if trouble in state:
-                del state[trouble]
-        return state
+        state = {
+            name: getattr(self, name)
+            for name in self._stateNames()
+            if name not in ("schema", "_customSchema") and hasattr(self, name)
+        }
+        return copy.deepcopy(state)
+
+    def __setstate__(self, state):
+        for name, val in state.items():
+            setattr(self, name, val)
+
+    def _stateNames(self):
+        """Return the names of all slotted and ``__dict__`` attributes on this object."""
+        names = []
+        for cls in type(self).__mro__:
+            names.extend(cls.__dict__.get("__slots__", ()))
+        names.extend(getattr(self, "__dict__", {}))
+        return names
 
     def revertToDefault(self):
         """
@@ -372,7 +463,7 @@ class FlagListSetting(Setting):
         flagVals = []
         for v in val:
             if isinstance(v, str):
-                flagVals.append(Flags.fromString(v))
+                flagVals.append(_flagsFromString(v))
             elif isinstance(v, Flags):
                 flagVals.append(v)
             else:
@@ -427,7 +427,18 @@ class SettingsWriter:
         stream.write(self.prettyPrintXmlRecursively(tree.getroot(), spacing=False))
 
     def writeYaml(self, stream):
-        """Write settings to YAML file."""
+        """
+        Write settings to YAML file.
+
+        Notes
+        -----
+        This deliberately uses the round-trip dumper rather than the faster safe
+        (libyaml) one. Setting values read from YAML input are ruamel ``CommentedMap``
+        and ``CommentedSeq`` objects, which the safe representer refuses to dump, and
+        the round-trip dumper is what honors the indentation configured below. In the
+        default ``short`` style only off-default settings are written, so the dump is
+        rarely large enough for the emitter to matter.
+        """
         settingData = self._getSettingDataToWrite()
         settingData = self._preprocessYaml(settingData)
         yaml = YAML()
@@ -14,13 +14,15 @@
 
 """Tests for new settings system with plugin import"""
 # pylint: disable=missing-function-docstring,missing-class-docstring,abstract-method,protected-access
-import copy
+import contextlib
 import io
 import logging
 import os
+import shutil
 import unittest
 
 from ruamel.yaml import YAML
+from ruamel.yaml.comments import CommentedSeq
 import voluptuous as vol
 
 import armi
@@ -37,6 +39,13 @@ from armi.utils.customExceptions import NonexistentSetting
 THIS_DIR = os.path.dirname(__file__)
 TEST_XML = os.path.join(THIS_DIR, "old_xml_settings_input.xml")
 
+# round-trip features are not needed to check schemas, so use the (C-backed when
+# available) safe loader
+_YAML = YAML(typ="safe")
+
+# the fuel handler settings are only inspected (never mutated) here, so build them once
+_FUEL_HANDLER_SETTINGS = FuelHandlerPlugin.defineSettings()
+
 
 class DummyPlugin1(plugins.ArmiPlugin):
     @staticmethod
@@ -64,6 +73,18 @@ class DummyPlugin2(plugins.ArmiPlugin):
         ]
 
 
+@contextlib.contextmanager
+def _registeredPlugins(pm, *pluginsToRegister):
+    """Register plugins, in order, for the duration of a ``with`` block."""
+    for plugin in pluginsToRegister:
+        pm.register(plugin)
+    try:
+        yield
+    finally:
+        for plugin in reversed(pluginsToRegister):
+            pm.unregister(plugin)
+
+
 class TestCaseSettings(unittest.TestCase):
     def setUp(self):
         self.cs = caseSettings.Settings()
@@ -87,43 +108,51 @@ class TestCaseSettings(unittest.TestCase):
 
 
 class TestSettings2(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Building a Settings object walks every plugin. Tests that only read it or
+        # derive new objects through ``modified()`` can safely share this one.
+        cls.cs = caseSettings.Settings()
+
     def setUp(self):
         # We are going to be messing with the plugin manager, which is global ARMI
-        # state, so we back it up and restore the original when we are done.
-        self._backupApp = copy.copy(armi._app)
+        # state, so we remember which plugins were registered and drop any extras
+        # when we are done.
+        self._backupPlugins = set(armi.getPluginManagerOrFail().get_plugins())
 
     def tearDown(self):
-        armi._app = self._backupApp
+        pm = armi.getPluginManagerOrFail()
+        for plugin in set(pm.get_plugins()) - self._backupPlugins:
+            pm.unregister(plugin)
 
     def testSchemaChecksType(self):
-        newSettings = FuelHandlerPlugin.defineSettings()
-
-        good_input = io.StringIO(
+        # the C loader works on bytes, so hand it encoded input directly
+        good_input = io.BytesIO(
             """
 assemblyRotationAlgorithm: buReducingAssemblyRotation
 shuffleLogic: {}
 """.format(
                 __file__
-            )
+            ).encode()
         )
 
-        bad_input = io.StringIO(
-            """
+        bad_input = io.BytesIO(
+            b"""
 assemblyRotationAlgorithm: buReducingAssemblyRotatoin
 """
         )
 
-        yaml = YAML()
+        settingsByName = {s.name: s for s in _FUEL_HANDLER_SETTINGS}
 
-        inp = yaml.load(good_input)
+        inp = _YAML.load(good_input)
         for inputSetting, inputVal in inp.items():
-            settin = [s for s in newSettings if s.name == inputSetting][0]
+            settin = settingsByName[inputSetting]
             settin.schema(inputVal)
 
-        inp = yaml.load(bad_input)
+        inp = _YAML.load(bad_input)
         for inputSetting, inputVal in inp.items():
+            settin = settingsByName[inputSetting]
             with self.assertRaises(vol.error.MultipleInvalid):
-                settin = [s for s in newSettings if s.name == inputSetting][0]
                 settin.schema(inputVal)
 
     def test_listsMutable(self):
@@ -146,6 +175,18 @@ assemblyRotationAlgorithm: buReducingAssemblyRotatoin
         self.assertEqual(listSetting.value, [1.0, 2.0, 3.0])
         self.assertTrue(isinstance(listSetting.value[0], float))
 
+        # list subclasses from round-trip YAML input keep their type
+        listSetting.value = CommentedSeq([4, 5])
+        self.assertIsInstance(listSetting.value, CommentedSeq)
+        self.assertEqual(listSetting.value, [4.0, 5.0])
+
+        # invalid entries or non-list values are still rejected by the full schema
+        with self.assertRaises(vol.error.MultipleInvalid):
+            listSetting.value = [1, "two", 3]
+        with self.assertRaises(vol.error.MultipleInvalid):
+            listSetting.value = 1.0
+        self.assertEqual(listSetting.value, [4.0, 5.0])
+
     def test_typeDetection(self):
         """Ensure some of the type inference operations work."""
         listSetting = setting.Setting(
@@ -171,8 +212,7 @@ assemblyRotationAlgorithm: buReducingAssemblyRotatoin
         self.assertEqual(a["circularRingOrder"], "angle")
 
     def test_pluginValidatorsAreDiscovered(self):
-        cs = caseSettings.Settings()
-        cs = cs.modified(
+        cs = self.cs.modified(
             caseTitle="test_pluginValidatorsAreDiscovered",
             newSettings={
                 "shuffleLogic": "nothere",
@@ -193,33 +233,30 @@ assemblyRotationAlgorithm: buReducingAssemblyRotatoin
 
     def test_pluginSettings(self):
         pm = armi.getPluginManagerOrFail()
-        pm.register(DummyPlugin1)
-        # We have a setting; this should be fine
-        cs = caseSettings.Settings()
+        with _registeredPlugins(pm, DummyPlugin1):
+            # We have a setting; this should be fine
+            cs = caseSettings.Settings()
 
-        self.assertEqual(cs["extendableOption"], "DEFAULT")
-        # We shouldn't have any settings from the other plugin, so this should be an
-        # error.
-        with self.assertRaises(vol.error.MultipleInvalid):
-            newSettings = {"extendableOption": "PLUGIN"}
-            cs = cs.modified(newSettings=newSettings)
+            self.assertEqual(cs["extendableOption"], "DEFAULT")
+            # We shouldn't have any settings from the other plugin, so this should be
+            # an error.
+            with self.assertRaises(vol.error.MultipleInvalid):
+                newSettings = {"extendableOption": "PLUGIN"}
+                cs = cs.modified(newSettings=newSettings)
 
-        pm.register(DummyPlugin2)
-        cs = caseSettings.Settings()
-        self.assertEqual(cs["extendableOption"], "PLUGIN")
-        # Now we should have the option from plugin 2; make sure that works
-        cs = cs.modified(newSettings=newSettings)
-        cs["extendableOption"] = "PLUGIN"
-        self.assertIn("extendableOption", cs.keys())
-        pm.unregister(DummyPlugin2)
-        pm.unregister(DummyPlugin1)
+            with _registeredPlugins(pm, DummyPlugin2):
+                cs = caseSettings.Settings()
+                self.assertEqual(cs["extendableOption"], "PLUGIN")
+                # Now we should have the option from plugin 2; make sure that works
+                cs = cs.modified(newSettings=newSettings)
+                cs["extendableOption"] = "PLUGIN"
+                self.assertIn("extendableOption", cs.keys())
 
         # Now try the same, but adding the plugins in a different order. This is to make
         # sure that it doesnt matter if the Setting or its Options come first
-        pm.register(DummyPlugin2)
-        pm.register(DummyPlugin1)
-        cs = caseSettings.Settings()
-        self.assertEqual(cs["extendableOption"], "PLUGIN")
+        with _registeredPlugins(pm, DummyPlugin2, DummyPlugin1):
+            cs = caseSettings.Settings()
+            self.assertEqual(cs["extendableOption"], "PLUGIN")
 
     def test_default(self):
         """Make sure default updating mechanism works."""
@@ -229,10 +266,9 @@ assemblyRotationAlgorithm: buReducingAssemblyRotatoin
         self.assertEqual(a.value, 5)
 
     def test_setModuleVerbosities(self):
-        # init settings and use them to set module-level logging levels
-        cs = caseSettings.Settings()
+        # use the settings to set module-level logging levels
         newSettings = {"moduleVerbosity": {"test_setModuleVerbosities": "debug"}}
-        cs = cs.modified(newSettings=newSettings)
+        cs = self.cs.modified(newSettings=newSettings)
 
         # set the logger once, and check it is was set
         cs.setModuleVerbosities()
@@ -251,7 +287,7 @@ assemblyRotationAlgorithm: buReducingAssemblyRotatoin
 
     def test_getFailures(self):
         """Make sure the correct error is thrown when getting a nonexistent setting"""
-        cs = caseSettings.Settings()
+        cs = self.cs
 
         with self.assertRaises(NonexistentSetting):
             cs.getSetting("missingFake")
@@ -261,8 +297,7 @@ assemblyRotationAlgorithm: buReducingAssemblyRotatoin
 
     def test_modified(self):
         """prove that using the modified() method does not mutate the original object"""
-        # init settings
-        cs = caseSettings.Settings()
+        cs = self.cs
 
         # prove this setting doesn't exist
         with self.assertRaises(NonexistentSetting):
@@ -302,23 +337,27 @@ class TestSettingsConversion(unittest.TestCase):
 class TestSettingsUtils(unittest.TestCase):
     """Tests for utility functions"""
 
-    def setUp(self):
-        self.dc = directoryChangers.TemporaryDirectoryChanger()
-        self.dc.__enter__()
+    @classmethod
+    def setUpClass(cls):
+        # The tests here only read the case suite, so it is only written once.
+        cls.dc = directoryChangers.TemporaryDirectoryChanger()
+        cls.dc.__enter__()
 
         # Create a little case suite on the fly. Whipping it up from defaults should be
-        # more evergreen than committing settings files as a test resource
+        # more evergreen than committing settings files as a test resource. The case
+        # title comes from the file name, so identical copies are enough.
         cs = caseSettings.Settings()
         cs.writeToYamlFile("settings1.yaml")
-        cs.writeToYamlFile("settings2.yaml")
+        shutil.copyfile("settings1.yaml", "settings2.yaml")
         with open("notSettings.yaml", "w") as f:
             f.write("some: other\n" "yaml: file\n")
         os.mkdir("subdir")
-        cs.writeToYamlFile("subdir/settings3.yaml")
-        cs.writeToYamlFile("subdir/skipSettings.yaml")
+        shutil.copyfile("settings1.yaml", os.path.join("subdir", "settings3.yaml"))
+        shutil.copyfile("settings1.yaml", os.path.join("subdir", "skipSettings.yaml"))
 
-    def tearDown(self):
-        self.dc.__exit__(None, None, None)
+    @classmethod
+    def tearDownClass(cls):
+        cls.dc.__exit__(None, None, None)
 
     def test_recursiveScan(self):
         loadedSettings = settings.recursivelyLoadSettingsFiles(
@@ -338,6 +377,13 @@ class TestSettingsUtils(unittest.TestCase):
         self.assertIn("settings2", names)
         self.assertNotIn("settings3", names)
 
+        # no patterns means no matches, recursive or not
+        for recursive in (True, False):
+            loadedSettings = settings.recursivelyLoadSettingsFiles(
+                ".", [], recursive=recursive
+            )
+            self.assertEqual(loadedSettings, [])
+
     def test_prompt(self):
         selection = settings.promptForSettingsFile(1)
         self.assertEqual(selection, "settings1.yaml")